@@ -1,13 +1,127 @@
 import os
+import sys
 import json
 import re
-import requests
+import reprlib
+import functools
+import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import orjson
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-from strands import Agent, tool
-from strands.models import BedrockModel
+
+# boto3 / strands are imported lazily inside MisinformationDetector —
+# they dominate cold-start time and endpoints like /results never need
+# them. dotenv stays here because PERPLEXITY_API_KEY is read at import.
+
+try:
+    import simdjson
+except ImportError:  # optional accelerator
+    simdjson = None
+
+# simdjson Parsers are single-document and not thread-safe, and agent
+# outputs parse concurrently (parallel agents, batch mode) — so each
+# worker thread keeps its own parser.
+_simd_parsers = threading.local()
+
+
+def _parse_json_candidate(candidate: str) -> Dict:
+    """Parse one JSON candidate with this thread's fastest parser."""
+    if simdjson is None:
+        return orjson.loads(candidate)
+    parser = getattr(_simd_parsers, "parser", None)
+    if parser is None:
+        parser = _simd_parsers.parser = simdjson.Parser()
+    return parser.parse(candidate).as_dict()
+
+try:
+    import numba
+    import numpy as np
+
+    @numba.njit(cache=True)
+    def _find_json_span(buf):
+        """Return (start, end) byte offsets of the first balanced {...}."""
+        brace_count = 0
+        start = -1
+        for i in range(buf.shape[0]):
+            c = buf[i]
+            if c == 123:  # '{'
+                if brace_count == 0:
+                    start = i
+                brace_count += 1
+            elif c == 125 and brace_count > 0:  # '}'
+                brace_count -= 1
+                if brace_count == 0:
+                    return start, i
+        return -1, -1
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # optional accelerator
+    _NUMBA_AVAILABLE = False
+
+# Structural-character scan: the regex engine skips non-brace bytes in
+# C, so Python-level work is per brace occurrence, not per byte.
+_BRACE_RE = re.compile(r'[{}]')
+
+# Fenced ```json blocks, compiled once. The old inline pattern had no
+# capture group and couldn't match a payload at all.
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def _find_balanced_end(text: str, start: int) -> int:
+    """Return the index of the '}' closing the '{' at `start`, or -1."""
+    depth = 0
+    for match in _BRACE_RE.finditer(text, start):
+        if match.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
+
+# Bounded previews for the execution log: reprlib truncates while it
+# walks, so a multi-MB search payload never gets fully stringified just
+# to keep 200 characters of it.
+_LOG_REPR = reprlib.Repr()
+_LOG_REPR.maxstring = 200
+_LOG_REPR.maxother = 200
+_LOG_REPR.maxdict = 5
+_LOG_REPR.maxlist = 3
+
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+# Exception handlers should stay cheap — bind print_exc once instead of
+# re-running an import statement inside every except block.
+_print_exc = traceback.print_exc
+
+
+def _claims_for_prompt(atomic_claims: List[Dict]) -> List[Dict]:
+    """Project atomic claims to the fields the prompts actually use.
+
+    The decomposer can attach reasoning and metadata per claim; only id,
+    statement, dependencies and priority inform downstream agents, and
+    inlining the rest just burns prompt tokens. Capped at
+    MAX_INLINE_CLAIMS items.
+    """
+    return [
+        {
+            "id": c.get("id"),
+            "statement": c.get("statement"),
+            "dependencies": c.get("dependencies", []),
+            "priority": c.get("priority", "medium")
+        }
+        for c in atomic_claims[:MAX_INLINE_CLAIMS]
+    ]
 
 
 # Load environment variables
@@ -17,15 +131,71 @@ load_dotenv()
 # Configuration
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
 PERPLEXITY_URL = "https://api.perplexity.ai/search"
+# Pre-encoded once: the REPL writes this after every claim.
+SEPARATOR = ("\n" + "=" * 80 + "\n").encode()
 RESULTS_DIR = "verification_results"
 NUM_SEARCH_QUERIES = 10
 MAX_PARALLEL_WORKERS = 3
+# In-flight Perplexity request cap; tune to the account's rate limit.
+SEARCH_CONCURRENCY = int(os.getenv("SEARCH_CONCURRENCY", "10"))
+# Caps on what gets interpolated into prompts; full data is still saved.
+MAX_INLINE_CLAIMS = int(os.getenv("MAX_INLINE_CLAIMS", "12"))
+MAX_INLINE_RESULTS = int(os.getenv("MAX_INLINE_RESULTS", "10"))
 SEARCH_TIMEOUT = 30
 MAX_TOKENS_CONFIG = 4096
 
 
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
+# Lightweight append-only manifest of saved results, so the API can list
+# them without an O(N) directory scan.
+RESULTS_INDEX = f"{RESULTS_DIR}/_index.jsonl"
+
+# Per-query Perplexity response cache. Search queries are informational
+# retrievals, so a day-old answer for the same normalized query is fine
+# — and a hit costs neither latency nor API spend.
+PPLX_CACHE_DIR = f"{RESULTS_DIR}/pplx_cache"
+PPLX_CACHE_TTL = 86400  # seconds
+
+os.makedirs(PPLX_CACHE_DIR, exist_ok=True)
+
+
+def record_result(filename: str, size: int, created: str):
+    """Append a saved result file to the manifest."""
+    with open(RESULTS_INDEX, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({
+            "filename": filename,
+            "size": size,
+            "created": created
+        }) + "\n")
+
+
+def rebuild_results_index():
+    """Rebuild the manifest from the directory contents.
+
+    Called at API startup so files written outside the normal save path
+    (or before the manifest existed) still show up in listings. Every
+    uvicorn worker runs this, so the rebuilt manifest is written to a
+    temp file and swapped in with os.replace — readers and concurrent
+    rebuilds never see a half-written file.
+    """
+    entries = []
+    with os.scandir(RESULTS_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append({
+                    "filename": entry.name,
+                    "size": stat.st_size,
+                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat()
+                })
+    entries.sort(key=lambda e: e["created"])
+    tmp_path = f"{RESULTS_INDEX}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    os.replace(tmp_path, RESULTS_INDEX)
+
 
 # System Prompts
 CLASSIFIER_SYSTEM_PROMPT = """You are a specialized claim classification expert.
@@ -226,11 +396,13 @@ IMPORTANT: Always respond with valid JSON:
 }"""
 
 
-@tool
 def get_current_datetime() -> str:
     """
     Get the current date and time.
-    
+
+    Wrapped with strands' @tool when the question generator is built,
+    so the decorator import doesn't land on module import.
+
     Returns:
         JSON string with current datetime information
     """
@@ -257,40 +429,87 @@ def extract_domain_from_url(url: str) -> str:
         return "unknown"
 
 
+# Translate table mapping every latin-1 char outside [a-zA-Z0-9] to '_':
+# a C-level lookup instead of running the regex engine over every char.
+# Codepoints beyond the table fall through unmapped, so the regex below
+# only needs to catch those.
+_SAFE_CHARS = str.maketrans({
+    c: '_' for c in map(chr, range(256))
+    if not ('a' <= c <= 'z' or 'A' <= c <= 'Z' or '0' <= c <= '9')
+})
+_NON_LATIN1_RE = re.compile(r'[^\x00-\xff]')
+_COLLAPSE_RE = re.compile(r'_+')
+
+
 def sanitize_filename(text: str) -> str:
     """Convert text to safe filename."""
-    text = re.sub(r'[^a-zA-Z0-9]', '_', text)
-    text = re.sub(r'_+', '_', text)
+    text = text.translate(_SAFE_CHARS)
+    text = _NON_LATIN1_RE.sub('_', text)  # anything the table can't cover
+    text = _COLLAPSE_RE.sub('_', text)
     return text[:50].strip('_')
 
 
-def direct_perplexity_search(query: str) -> Dict:
+def _pplx_cache_path(query: str) -> str:
+    """Cache file path for a normalized search query."""
+    key = hashlib.sha256(query.strip().lower().encode()).hexdigest()
+    return f"{PPLX_CACHE_DIR}/{key}.json"
+
+
+def _pplx_cache_get(query: str) -> Optional[Dict]:
+    """Return a cached search response if present and fresh."""
+    path = _pplx_cache_path(query)
+    try:
+        if time.time() - os.path.getmtime(path) < PPLX_CACHE_TTL:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+    except OSError:
+        pass
+    return None
+
+
+def _pplx_cache_put(query: str, result: Dict):
+    """Store a successful search response; cache failures are non-fatal."""
+    try:
+        with open(_pplx_cache_path(query), 'wb') as f:
+            f.write(orjson.dumps(result))
+    except OSError:
+        pass
+
+
+async def direct_perplexity_search(query: str, client: httpx.AsyncClient) -> Dict:
     """
     Execute search directly via Perplexity API.
-    
+
     Args:
         query: The search query string
-        
+        client: Shared async HTTP client (keep-alive, HTTP/2)
+
     Returns:
         Dictionary with search results
     """
+    cached = _pplx_cache_get(query)
+    if cached is not None:
+        return cached
+
     try:
         payload = {"query": query}
-        
+
         headers = {
             "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
             "Content-Type": "application/json"
         }
-        
-        response = requests.post(
+
+        response = await client.post(
             PERPLEXITY_URL,
             json=payload,
             headers=headers,
             timeout=SEARCH_TIMEOUT
         )
-        
+
         if response.status_code == 200:
-            data = response.json()
+            # orjson parses the raw bytes directly — no intermediate str
+            # decode, and 2-3x faster than stdlib json on these payloads.
+            data = orjson.loads(response.content)
             
             if isinstance(data, dict) and 'results' in data:
                 results = data.get('results', [])
@@ -314,12 +533,14 @@ def direct_perplexity_search(query: str) -> Dict:
                         "domain": extract_domain_from_url(result.get('url', ''))
                     })
                 
-                return {
+                response_data = {
                     "success": True,
                     "query": query,
                     "results": formatted_results,
                     "count": len(formatted_results)
                 }
+                _pplx_cache_put(query, response_data)
+                return response_data
             else:
                 return {
                     "success": False,
@@ -356,7 +577,7 @@ def direct_perplexity_search(query: str) -> Dict:
                 "count": 0
             }
     
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return {
             "success": False,
             "error": "Request timeout",
@@ -375,6 +596,98 @@ def direct_perplexity_search(query: str) -> Dict:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class ClaimResult:
+    """One verification run's outputs.
+
+    Slotted and frozen: no per-instance __dict__, and fields can't be
+    rebound after construction. Every field — execution_log included —
+    is built fresh for the run, so nothing appends to a result after it
+    has been cached or returned. orjson serializes dataclasses natively,
+    so saving needs no dict conversion.
+    """
+    classification: Dict
+    decomposition: Dict
+    questions: Dict
+    search_results: List[Dict]
+    evaluation: Dict
+    execution_log: List[Dict]
+
+
+class _RunLog:
+    """Execution log for a single verification run.
+
+    Each verify_claim_async call owns one, so concurrent claims on the
+    shared detector can't interleave entries or clobber each other's
+    elapsed_ms baseline.
+    """
+    __slots__ = ("rows", "timestamp", "start_ns")
+
+    def __init__(self, started: datetime):
+        self.rows: List[Dict] = []
+        self.timestamp = started.isoformat()
+        self.start_ns = time.monotonic_ns()
+
+    def add(self, step: str, agent: str, input_data: Any, output_data: Any):
+        """Log one workflow execution step."""
+        # One wall-clock read per run; steps carry a cheap monotonic
+        # offset instead of formatting a fresh timestamp each.
+        self.rows.append({
+            "timestamp": self.timestamp,
+            "elapsed_ms": (time.monotonic_ns() - self.start_ns) // 1_000_000,
+            "step": step,
+            "agent": agent,
+            "input_preview": _LOG_REPR.repr(input_data) if input_data else None,
+            "output_preview": _LOG_REPR.repr(output_data) if output_data else None,
+            "full_output": output_data
+        })
+
+
+class LLMCache:
+    """
+    Exact-match cache for agent responses, persisted in SQLite.
+
+    Agent calls here run at temperature <=0.3, so replays of the same
+    (system prompt, user prompt, model, temperature) are representative —
+    repeated and regression claims skip the Bedrock round trip entirely.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(system_prompt: str, user_prompt: str, model: str, temperature: float) -> str:
+        """Build the exact cache key for one agent call."""
+        blob = json.dumps({
+            "sys": system_prompt,
+            "user": user_prompt,
+            "model": model,
+            "temp": temperature
+        }, sort_keys=True)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, response: Dict):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response) VALUES (?, ?)",
+                (key, json.dumps(response, ensure_ascii=False))
+            )
+            self._conn.commit()
+
+
 class MisinformationDetector:
     """
     Orchestrator for multi-agent misinformation detection workflow.
@@ -382,98 +695,183 @@ class MisinformationDetector:
     
     def __init__(self):
         print("🔧 Initializing Multi-Agent System...")
-        print(f"📊 Configuration: {NUM_SEARCH_QUERIES} queries, {MAX_PARALLEL_WORKERS} parallel workers")
-        print(f"⚙️ Max Tokens: {MAX_TOKENS_CONFIG}\n")
-        
-        print("="*80)
-        print("🤖 AGENT INITIALIZATION")
-        print("="*80)
-        
-        print("\n[1/4] Classification Agent")
-        classifier_model = BedrockModel(
-            model_id="amazon.nova-pro-v1:0",
-            temperature=0.3,
-            max_tokens=MAX_TOKENS_CONFIG
-        )
-        self.classifier = Agent(
-            model=classifier_model,
-            system_prompt=CLASSIFIER_SYSTEM_PROMPT
-        )
-        print("✅ Ready\n")
-        
-        print("[2/4] Decomposition Agent")
-        decomposer_model = BedrockModel(
-            model_id="amazon.nova-pro-v1:0",
-            temperature=0.3,
-            max_tokens=MAX_TOKENS_CONFIG
+        print(f"📊 Configuration: {NUM_SEARCH_QUERIES} queries, {SEARCH_CONCURRENCY} concurrent searches")
+        print(f"⚙️ Max Tokens: {MAX_TOKENS_CONFIG}")
+        print("ℹ️ Search uses direct Perplexity API (/search endpoint)")
+        print("ℹ️ Agents are constructed per run; models are shared\n")
+
+        self._llm_cache = LLMCache(f"{RESULTS_DIR}/cache/llm_cache.db")
+
+        # Result files are written off the critical path: one worker
+        # keeps writes ordered, failures surface at the next run.
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="results-writer"
         )
-        self.decomposer = Agent(
-            model=decomposer_model,
-            system_prompt=DECOMPOSER_SYSTEM_PROMPT
+        self._pending_saves = []
+
+    @functools.cached_property
+    def _models(self):
+        """Shared and evaluator Bedrock models, built on first agent use.
+
+        One boto session and client config shared by every agent: the
+        agents differ only in system prompt (and the evaluator's
+        temperature), so separate Bedrock clients just meant separate
+        connection pools and three extra TLS handshakes on first call.
+        The heavy boto3/strands imports also land here, off the module
+        import path.
+        """
+        import boto3
+        from botocore.config import Config
+        from strands.models import BedrockModel
+
+        boto_session = boto3.Session()
+        boto_config = Config(
+            max_pool_connections=8,
+            retries={"mode": "adaptive"}
         )
-        print("✅ Ready\n")
-        
-        print("[3/4] Question Generation Agent")
-        question_model = BedrockModel(
+
+        shared_model = BedrockModel(
             model_id="amazon.nova-pro-v1:0",
             temperature=0.3,
-            max_tokens=MAX_TOKENS_CONFIG
+            max_tokens=MAX_TOKENS_CONFIG,
+            boto_session=boto_session,
+            boto_client_config=boto_config
         )
-        self.question_generator = Agent(
-            model=question_model,
-            tools=[get_current_datetime],
-            system_prompt=QUESTION_GENERATOR_SYSTEM_PROMPT
-        )
-        print("✅ Ready\n")
-        
-        print("[4/4] Evaluation Agent")
         evaluator_model = BedrockModel(
             model_id="amazon.nova-pro-v1:0",
             temperature=0.2,
-            max_tokens=MAX_TOKENS_CONFIG
+            max_tokens=MAX_TOKENS_CONFIG,
+            boto_session=boto_session,
+            boto_client_config=boto_config
         )
-        self.evaluator = Agent(
-            model=evaluator_model,
-            system_prompt=EVALUATOR_SYSTEM_PROMPT
+        return shared_model, evaluator_model
+
+    def _build_agents(self):
+        """Build a fresh agent set for one verification run.
+
+        strands Agents carry per-conversation state (messages), so
+        concurrent runs must never share an instance — one claim's
+        conversation would leak into another's prompts. Agents are
+        cheap wrappers; the expensive parts (boto session, Bedrock
+        models and their connection pools) stay shared via _models.
+
+        Returns:
+            (classifier, decomposer, question_generator, evaluator)
+        """
+        from strands import Agent, tool
+
+        shared_model, evaluator_model = self._models
+        return (
+            Agent(model=shared_model, system_prompt=CLASSIFIER_SYSTEM_PROMPT),
+            Agent(model=shared_model, system_prompt=DECOMPOSER_SYSTEM_PROMPT),
+            Agent(
+                model=shared_model,
+                tools=[tool(get_current_datetime)],
+                system_prompt=QUESTION_GENERATOR_SYSTEM_PROMPT
+            ),
+            Agent(model=evaluator_model, system_prompt=EVALUATOR_SYSTEM_PROMPT),
         )
-        print("✅ Ready\n")
-        
-        print("="*80)
-        print("ℹ️ Search uses direct Perplexity API (/search endpoint)\n")
-        
-        self.execution_log = []
-    
-    def _log_step(self, step: str, agent: str, input_data: Any, output_data: Any):
-        """Log workflow execution step."""
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "step": step,
-            "agent": agent,
-            "input_preview": str(input_data)[:200] if input_data else None,
-            "output_preview": str(output_data)[:200] if output_data else None,
-            "full_output": output_data
-        }
-        self.execution_log.append(log_entry)
-    
-    def _save_results(self, claim: str, results: Dict) -> str:
-        """Save verification results to JSON file with timestamp_query format."""
+
+    def _cached_agent_call(self, agent: "Agent", system_prompt: str,
+                           prompt: str, temperature: float) -> Dict:
+        """Call an agent and parse its JSON output, via the LLM cache.
+
+        Responses are only cached when temperature <=0.3 and the output
+        parsed cleanly, so sampling-heavy or garbled responses never
+        stick.
+        """
+        if temperature > 0.3:
+            return self._extract_json_from_result(agent(prompt))
+
+        key = LLMCache.make_key(
+            system_prompt, prompt, "amazon.nova-pro-v1:0", temperature
+        )
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            print("  ⚡ LLM cache hit")
+            return cached
+
+        parsed = self._extract_json_from_result(agent(prompt))
+        if not parsed.get("parse_error") and not parsed.get("error"):
+            self._llm_cache.put(key, parsed)
+        return parsed
+
+    def _save_results(self, claim: str, results: ClaimResult) -> str:
+        """Queue results for a background write; returns the filename.
+
+        The caller gets its verdict back without waiting on disk. The
+        result owns its per-run execution log, so the writer never races
+        appends from another claim; failures surface via _reap_saves at
+        the start of the next run.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         query_part = sanitize_filename(claim)
         filename = f"{RESULTS_DIR}/{timestamp}_{query_part}.json"
-        
+
+        # The log is saved once as rows (the layout the frontend reads)
+        # and once as columns — one list per field, no per-row key
+        # repetition, loads straight into dataframe tooling. The row
+        # copy that used to ride along inside results is dropped; it
+        # duplicated the top-level log byte for byte.
+        log_rows = results.execution_log
+        log_columns = {
+            "timestamp": [row["timestamp"] for row in log_rows],
+            "elapsed_ms": [row["elapsed_ms"] for row in log_rows],
+            "step": [row["step"] for row in log_rows],
+            "agent": [row["agent"] for row in log_rows],
+            "input_preview": [row["input_preview"] for row in log_rows],
+            "output_preview": [row["output_preview"] for row in log_rows]
+        }
+
+        # Field access instead of asdict(): asdict deep-copies the whole
+        # nested result tree and orjson can serialize the values as-is.
         output = {
             "original_claim": claim,
             "timestamp": datetime.now().isoformat(),
             "workflow_version": "2.2_final",
-            "execution_log": self.execution_log,
-            "results": results
+            "execution_log": log_rows,
+            "execution_log_columns": log_columns,
+            "results": {
+                "classification": results.classification,
+                "decomposition": results.decomposition,
+                "questions": results.questions,
+                "search_results": results.search_results,
+                "evaluation": results.evaluation
+            }
         }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n💾 Results saved to: {filename}")
+
+        self._pending_saves.append(
+            self._save_executor.submit(self._write_results, filename, output)
+        )
         return filename
+
+    def _write_results(self, filename: str, output: Dict):
+        """Serialize and write one result file (runs on the writer thread)."""
+        # Compact orjson by default — pretty-printing doubles the bytes
+        # and the serialization time; set PRETTY_JSON for debugging.
+        option = orjson.OPT_INDENT_2 if os.environ.get("PRETTY_JSON") else 0
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(output, option=option))
+
+        record_result(
+            os.path.basename(filename),
+            os.path.getsize(filename),
+            output["timestamp"]
+        )
+
+        print(f"\n💾 Results saved to: {filename}")
+
+    def _reap_saves(self):
+        """Surface errors from finished background saves."""
+        still_pending = []
+        for future in self._pending_saves:
+            if future.done():
+                error = future.exception()
+                if error is not None:
+                    print(f"⚠️ Background save failed: {error}")
+            else:
+                still_pending.append(future)
+        self._pending_saves = still_pending
     
     def _extract_json_from_result(self, result) -> Dict:
         """Extract JSON from agent result with robust parsing."""
@@ -503,34 +901,55 @@ class MisinformationDetector:
             else:
                 text = str(result)
             
-            # Try direct JSON parse
+            # Try direct JSON parse (orjson's SIMD-backed parser)
             try:
-                return json.loads(text)
-            except json.JSONDecodeError:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
                 pass
-            
-            # Extract JSON from text using brace matching
-            brace_count = 0
-            start_idx = -1
-            for i, char in enumerate(text):
-                if char == '{':
-                    if brace_count == 0:
-                        start_idx = i
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0 and start_idx != -1:
-                        try:
-                            return json.loads(text[start_idx:i+1])
-                        except json.JSONDecodeError:
-                            pass
+
+            # With numba installed, the balanced-brace scan runs as
+            # native code over a uint8 view of the utf-8 bytes — the
+            # span is byte offsets, so parse the byte slice directly.
+            if _NUMBA_AVAILABLE:
+                buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+                span_start, span_end = _find_json_span(buf)
+                if span_start != -1:
+                    try:
+                        return orjson.loads(buf[span_start:span_end + 1].tobytes())
+                    except orjson.JSONDecodeError:
+                        pass
+
+            # Extract the embedded {...} without walking the text
+            # char-by-char in Python: locate the outermost braces with
+            # find/rfind and let the C parser (simdjson when installed,
+            # orjson otherwise) validate candidates, trimming the tail
+            # back to the previous '}' after each failure. The loop runs
+            # per '}' occurrence, not per byte.
+            start = text.find('{')
+            if start != -1:
+                # First try the balanced span found by the structural
+                # scan — one parse attempt instead of trimming from the
+                # tail through every trailing '}'.
+                balanced_end = _find_balanced_end(text, start)
+                if balanced_end != -1:
+                    try:
+                        return _parse_json_candidate(text[start:balanced_end + 1])
+                    except Exception:
+                        pass
+
+                end = text.rfind('}')
+                while end > start:
+                    try:
+                        return _parse_json_candidate(text[start:end + 1])
+                    except Exception:
+                        end = text.rfind('}', start, end)
             
             # Try extracting from code blocks
-            code_block_match = re.search(r'``````', text, re.DOTALL)
+            code_block_match = _CODE_BLOCK_RE.search(text)
             if code_block_match:
                 try:
-                    return json.loads(code_block_match.group(1))
-                except json.JSONDecodeError:
+                    return orjson.loads(code_block_match.group(1))
+                except orjson.JSONDecodeError:
                     pass
             
             print(f"⚠️ JSON extraction warning: Could not parse")
@@ -540,28 +959,34 @@ class MisinformationDetector:
             print(f"⚠️ JSON extraction error: {str(e)}")
             return {"raw_output": str(result), "error": str(e)}
     
-    def _execute_parallel_searches(self, queries: List[Dict]) -> List[Dict]:
-        """Execute multiple searches in parallel using direct API calls."""
-        search_results = []
-        
-        def execute_single_search(query_obj: Dict) -> Dict:
+    async def _execute_parallel_searches(self, queries: List[Dict]) -> List[Dict]:
+        """Execute multiple searches concurrently over one pooled HTTP client.
+
+        All queries fly at once on keep-alive HTTP/2 connections, so the
+        search step costs roughly the slowest single round trip instead
+        of ceil(N/workers) serialized batches with a TLS handshake each.
+        The client lives for one search phase — pooled sockets must not
+        outlive the event loop they were opened on.
+        """
+
+        async def execute_single_search(query_obj: Dict, client: httpx.AsyncClient) -> Dict:
             """Execute a single search query."""
             query = query_obj.get('query', '')
             query_id = query_obj.get('id', '')
-            
+
             try:
                 print(f"  🔍 [{query_id}] {query[:70]}...")
-                result_data = direct_perplexity_search(query)
-                
+                result_data = await direct_perplexity_search(query, client)
+
                 success = result_data.get('success', False)
                 results_list = result_data.get('results', [])
-                
+
                 if success and results_list:
                     print(f"  ✅ [{query_id}] Found {len(results_list)} results")
                 else:
                     error_msg = result_data.get('error', 'No results')
                     print(f"  ❌ [{query_id}] {error_msg}")
-                
+
                 return {
                     "query_id": query_id,
                     "query": query,
@@ -572,7 +997,7 @@ class MisinformationDetector:
                     "success": success,
                     "error": result_data.get('error') if not success else None
                 }
-            
+
             except Exception as e:
                 print(f"  ❌ [{query_id}] Exception: {str(e)}")
                 return {
@@ -585,37 +1010,76 @@ class MisinformationDetector:
                     "success": False,
                     "error": str(e)
                 }
-        
-        print(f"\n  🔄 Executing {min(len(queries), NUM_SEARCH_QUERIES)} searches in parallel...")
-        
-        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_WORKERS) as executor:
-            future_to_query = {
-                executor.submit(execute_single_search, q): q
-                for q in queries[:NUM_SEARCH_QUERIES]
-            }
-            
-            for future in as_completed(future_to_query):
-                try:
-                    result = future.result(timeout=SEARCH_TIMEOUT + 5)
-                    search_results.append(result)
-                except Exception as e:
-                    query = future_to_query[future]
-                    print(f"  ❌ [{query.get('id', '?')}] Timeout: {str(e)}")
-                    search_results.append({
-                        "query_id": query.get('id', 'unknown'),
-                        "query": query.get('query', ''),
-                        "claim_id": query.get('claim_id', 'unknown'),
-                        "query_type": query.get('query_type', 'unknown'),
-                        "priority": query.get('priority', 'medium'),
-                        "results": [],
-                        "success": False,
-                        "error": f"Execution timeout: {str(e)}"
-                    })
-        
+
+        to_run = queries[:NUM_SEARCH_QUERIES]
+
+        # The question generator sometimes emits variants that normalize
+        # to the same string — dispatch each unique query once and share
+        # the response. Every duplicate collapsed here is a Perplexity
+        # call saved.
+        unique_queries: Dict[str, Dict] = {}
+        for query_obj in to_run:
+            key = query_obj.get('query', '').strip().lower()
+            unique_queries.setdefault(key, query_obj)
+
+        if len(unique_queries) < len(to_run):
+            print(f"  ♻️ Collapsed {len(to_run) - len(unique_queries)} duplicate queries")
+
+        print(f"\n  🔄 Executing {len(unique_queries)} searches in parallel...")
+
+        # Bound in-flight requests with a semaphore sized to the rate
+        # limit rather than a thread-pool worker count — all queries fly
+        # at once when the limit allows, with no thread churn.
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+        async def bounded_search(query_obj: Dict, client: httpx.AsyncClient) -> Dict:
+            async with semaphore:
+                return await execute_single_search(query_obj, client)
+
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=NUM_SEARCH_QUERIES)
+        ) as client:
+            fetched = await asyncio.gather(
+                *(bounded_search(q, client) for q in unique_queries.values())
+            )
+
+        results_by_key = dict(zip(unique_queries, fetched))
+
+        # Broadcast each shared response back onto every original query
+        # object so the downstream shape (one entry per query_id) holds.
+        search_results = []
+        for query_obj in to_run:
+            shared = results_by_key[query_obj.get('query', '').strip().lower()]
+            search_results.append({
+                "query_id": query_obj.get('id', ''),
+                "query": query_obj.get('query', ''),
+                "claim_id": query_obj.get('claim_id', 'unknown'),
+                "query_type": query_obj.get('query_type', 'unknown'),
+                "priority": query_obj.get('priority', 'medium'),
+                "results": shared["results"],
+                "success": shared["success"],
+                "error": shared["error"]
+            })
+
         return search_results
     
-    def verify_claim(self, claim: str) -> Dict:
-        """Main workflow orchestration for claim verification."""
+    def verify_claim(self, claim: str) -> ClaimResult:
+        """Main workflow orchestration for claim verification.
+
+        Sync entry point: runs the async workflow on one event loop for
+        the whole claim instead of spinning a loop up per phase.
+        """
+        return asyncio.run(self.verify_claim_async(claim))
+
+    async def verify_claim_async(self, claim: str) -> ClaimResult:
+        """Async claim-verification workflow.
+
+        The whole pipeline lives on the caller's event loop — agent
+        calls hop to threads (boto3 is blocking), searches fan out over
+        pooled HTTP/2 connections, and concurrent claims can share the
+        loop instead of serializing behind asyncio.run per phase.
+        """
         print(f"\n{'='*80}")
         print(f"🔍 MISINFORMATION DETECTION WORKFLOW")
         print(f"{'='*80}")
@@ -623,9 +1087,15 @@ class MisinformationDetector:
         
         current_dt = datetime.now()
         date_context = f"Current Date: {current_dt.strftime('%B %d, %Y')} ({current_dt.strftime('%Y-%m-%d')})"
+        run_log = _RunLog(current_dt)
+        self._reap_saves()
+        classifier, decomposer, question_generator, evaluator = self._build_agents()
         
-        # Step 1: Classification
-        print("📋 [STEP 1/5] Classification Agent")
+        # Steps 1+2: Classification and Decomposition. Decomposition only
+        # needs the raw claim, not the classification JSON, so both agents
+        # run concurrently — one Bedrock round trip on the critical path
+        # instead of two.
+        print("📋 [STEP 1+2/5] Classification + Decomposition Agents (parallel)")
         classification_prompt = f"""Classify this claim:
 
 {date_context}
@@ -633,44 +1103,55 @@ class MisinformationDetector:
 Claim: "{claim}"
 
 Provide your classification in JSON format."""
-        
-        try:
-            classification_result = self.classifier(classification_prompt)
-            classification = self._extract_json_from_result(classification_result)
-            self._log_step("classification", "classifier_agent", claim, classification)
-            
-            print(f"  ✅ Domain: {classification.get('domain', 'N/A')}")
-            print(f"  ✅ Type: {classification.get('claim_type', 'N/A')}")
-            print(f"  ✅ Complexity: {classification.get('complexity', 'N/A')}\n")
-        except Exception as e:
-            print(f"  ❌ Classification failed: {str(e)}")
-            classification = {"error": str(e)}
-        
-        # Step 2: Decomposition
-        print("🧩 [STEP 2/5] Decomposition Agent")
+
         decomposition_prompt = f"""Break down this claim into atomic sub-claims with dependencies:
 
 {date_context}
 
 Claim: "{claim}"
 
-Classification: {json.dumps(classification, indent=2)}
-
 Provide decomposition in JSON format with dependencies identified."""
-        
-        try:
-            decomposition_result = self.decomposer(decomposition_prompt)
-            decomposition = self._extract_json_from_result(decomposition_result)
+
+        classification_result, decomposition_result = await asyncio.gather(
+            asyncio.to_thread(
+                self._cached_agent_call, classifier,
+                CLASSIFIER_SYSTEM_PROMPT, classification_prompt, 0.3
+            ),
+            asyncio.to_thread(
+                self._cached_agent_call, decomposer,
+                DECOMPOSER_SYSTEM_PROMPT, decomposition_prompt, 0.3
+            ),
+            return_exceptions=True
+        )
+
+        if isinstance(classification_result, Exception):
+            print(f"  ❌ Classification failed: {str(classification_result)}")
+            classification = {"error": str(classification_result)}
+        else:
+            classification = classification_result
+            run_log.add("classification", "classifier_agent", claim, classification)
+
+            print(f"  ✅ Domain: {classification.get('domain', 'N/A')}")
+            print(f"  ✅ Type: {classification.get('claim_type', 'N/A')}")
+            print(f"  ✅ Complexity: {classification.get('complexity', 'N/A')}\n")
+
+        if isinstance(decomposition_result, Exception):
+            print(f"  ❌ Decomposition failed: {str(decomposition_result)}")
+            decomposition = {"error": str(decomposition_result)}
+            atomic_claims = []
+            dependency_graph = {}
+        else:
+            decomposition = decomposition_result
             atomic_claims = decomposition.get('atomic_claims', [])
             dependency_graph = decomposition.get('dependency_graph', {})
-            self._log_step("decomposition", "decomposer_agent", classification, decomposition)
-            
+            run_log.add("decomposition", "decomposer_agent", claim, decomposition)
+
             foundational = dependency_graph.get('foundational', [])
             derived = dependency_graph.get('derived', [])
-            
+
             print(f"  ✅ Generated {len(atomic_claims)} atomic claims")
             print(f"  ✅ Foundational: {len(foundational)}, Derived: {len(derived)}\n")
-            
+
             for claim_obj in atomic_claims[:3]:
                 deps = claim_obj.get('dependencies', [])
                 dep_str = f" (depends on: {', '.join(deps)})" if deps else " (foundational)"
@@ -678,32 +1159,31 @@ Provide decomposition in JSON format with dependencies identified."""
             if len(atomic_claims) > 3:
                 print(f"    ... and {len(atomic_claims) - 3} more")
             print()
-        except Exception as e:
-            print(f"  ❌ Decomposition failed: {str(e)}")
-            decomposition = {"error": str(e)}
-            atomic_claims = []
-            dependency_graph = {}
         
         # Step 3: Question Generation
         print("❓ [STEP 3/5] Question Generation Agent")
+        prompt_claims = _claims_for_prompt(atomic_claims)
         question_prompt = f"""IMPORTANT: First call get_current_datetime() tool.
 
 Then generate exactly {NUM_SEARCH_QUERIES} search queries for:
 
 Original Claim: "{claim}"
 
-Atomic Claims: {json.dumps(atomic_claims, indent=2)}
+Atomic Claims: {orjson.dumps(prompt_claims).decode()}
 
-Dependency Graph: {json.dumps(dependency_graph, indent=2)}
+Dependency Graph: {orjson.dumps(dependency_graph).decode()}
 
 Prioritize foundational claims first, then derived claims.
 Provide queries in JSON format."""
         
         try:
-            question_result = self.question_generator(question_prompt)
-            questions = self._extract_json_from_result(question_result)
+            questions = await asyncio.to_thread(
+                self._cached_agent_call,
+                question_generator, QUESTION_GENERATOR_SYSTEM_PROMPT,
+                question_prompt, 0.3
+            )
             queries = questions.get('queries', [])
-            self._log_step("question_generation", "question_agent", decomposition, questions)
+            run_log.add("question_generation", "question_agent", decomposition, questions)
             
             print(f"  ✅ Generated {len(queries)} search queries")
             print(f"  ✅ Current date used: {questions.get('current_date_used', 'N/A')}\n")
@@ -715,55 +1195,79 @@ Provide queries in JSON format."""
         # Step 4: Search Execution
         print("🔎 [STEP 4/5] Parallel Search Execution (Perplexity API)")
         try:
-            search_results = self._execute_parallel_searches(queries)
-            self._log_step("search_execution", "perplexity_api", queries, search_results)
+            search_results = await self._execute_parallel_searches(queries)
+            run_log.add("search_execution", "perplexity_api", queries, search_results)
             
-            total_results = sum(len(sr.get('results', [])) for sr in search_results)
-            successful = sum(1 for sr in search_results if sr.get('success', False))
+            # Single pass over the results for both counters.
+            total_results = 0
+            successful = 0
+            for sr in search_results:
+                total_results += len(sr.get('results', []))
+                if sr.get('success', False):
+                    successful += 1
             
             print(f"\n  ✅ Completed {len(search_results)}/{NUM_SEARCH_QUERIES} searches ({successful} successful)")
             print(f"  ✅ Retrieved {total_results} total results\n")
         except Exception as e:
             print(f"  ❌ Search execution failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            _print_exc()
             search_results = []
         
         # Step 5: Evaluation
         print("⚖️ [STEP 5/5] Evaluation Agent")
         
-        # Condense results for evaluation
+        # Condense results for evaluation in a single pass. (A numpy
+        # structured array was considered here, but for ~10 queries x 3
+        # kept results the copy of variable-length strings into fixed
+        # width buffers costs more than the loop it replaces.) A shared
+        # URL set dedupes sources across queries, so the same page never
+        # reaches the evaluator prompt twice.
+        seen_urls = set()
         condensed_results = []
         for sr in search_results:
-            results_preview = []
-            for r in sr.get('results', [])[:3]:
-                results_preview.append({
-                    "title": r.get("title", ""),
-                    "url": r.get("url", ""),
-                    "snippet": r.get("snippet", "")[:300],
-                    "domain": r.get("domain", "")
+            top_results = []
+            for r in sr["results"][:3]:
+                if r["url"] in seen_urls:
+                    continue
+                seen_urls.add(r["url"])
+                top_results.append({
+                    "title": r["title"],
+                    "url": r["url"],
+                    "snippet": r["snippet"][:300],
+                    "domain": r["domain"]
                 })
-            
             condensed_results.append({
-                "query_id": sr.get("query_id"),
-                "query": sr.get("query"),
-                "claim_id": sr.get("claim_id"),
-                "success": sr.get("success"),
-                "result_count": len(sr.get("results", [])),
-                "top_results": results_preview
+                "query_id": sr["query_id"],
+                "query": sr["query"],
+                "claim_id": sr["claim_id"],
+                "priority": sr["priority"],
+                "success": sr["success"],
+                "result_count": len(sr["results"]),
+                "top_results": top_results
             })
-        
+
+        # Keep the evaluator prompt bounded: past MAX_INLINE_RESULTS
+        # query blocks, inline the highest-priority ones and let the
+        # saved results keep the full set.
+        if len(condensed_results) > MAX_INLINE_RESULTS:
+            prompt_results = sorted(
+                condensed_results,
+                key=lambda sr: _PRIORITY_RANK.get(sr["priority"], 1)
+            )[:MAX_INLINE_RESULTS]
+        else:
+            prompt_results = condensed_results
+
         evaluation_prompt = f"""Evaluate evidence and provide verdict with dependency analysis:
 
 {date_context}
 
 Original Claim: "{claim}"
 
-Atomic Claims: {json.dumps(atomic_claims, indent=2)}
+Atomic Claims: {orjson.dumps(prompt_claims).decode()}
 
-Dependency Graph: {json.dumps(dependency_graph, indent=2)}
+Dependency Graph: {orjson.dumps(dependency_graph).decode()}
 
-Search Results: {json.dumps(condensed_results, indent=2)}
+Search Results: {orjson.dumps(prompt_results).decode()}
 
 IMPORTANT: Verify foundational claims before evaluating derived claims.
 If a foundational claim is false, mark dependent claims accordingly.
@@ -771,15 +1275,17 @@ If a foundational claim is false, mark dependent claims accordingly.
 Provide comprehensive verdict in JSON format."""
         
         try:
-            evaluation_result = self.evaluator(evaluation_prompt)
-            evaluation = self._extract_json_from_result(evaluation_result)
-            self._log_step("evaluation", "evaluator_agent", condensed_results, evaluation)
+            evaluation = await asyncio.to_thread(
+                self._cached_agent_call,
+                evaluator, EVALUATOR_SYSTEM_PROMPT,
+                evaluation_prompt, 0.2
+            )
+            run_log.add("evaluation", "evaluator_agent", condensed_results, evaluation)
             
             print(f"  ✅ Evaluation complete\n")
         except Exception as e:
             print(f"  ❌ Evaluation failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            _print_exc()
             evaluation = {"error": str(e)}
         
         # Display final verdict
@@ -821,18 +1327,96 @@ Provide comprehensive verdict in JSON format."""
         
         print(f"{'='*80}\n")
         
-        results = {
-            "classification": classification,
-            "decomposition": decomposition,
-            "questions": questions,
-            "search_results": search_results,
-            "evaluation": evaluation,
-            "execution_log": self.execution_log  # Include execution_log in return value
-        }
-        
+        results = ClaimResult(
+            classification=classification,
+            decomposition=decomposition,
+            questions=questions,
+            search_results=search_results,
+            evaluation=evaluation,
+            execution_log=run_log.rows  # Include execution_log in return value
+        )
+
         self._save_results(claim, results)
         return results
 
+    def verify_claims_batch(self, claims: List[str]) -> List[ClaimResult]:
+        """
+        Verify a batch of claims in one dispatch.
+
+        Used by the API's micro-batching queue so concurrent requests
+        share a single detector hand-off instead of paying one each.
+        Claims run concurrently on one event loop, bounded by
+        MAX_PARALLEL_WORKERS — a batch costs roughly its slowest claim,
+        not the sum.
+
+        Args:
+            claims: List of claim texts to verify
+
+        Returns:
+            List of ClaimResult objects aligned with the input order
+        """
+        if len(claims) == 1:
+            return [self.verify_claim(claims[0])]
+
+        async def _run_batch() -> List[ClaimResult]:
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_WORKERS)
+
+            async def bounded_verify(claim: str) -> ClaimResult:
+                async with semaphore:
+                    return await self.verify_claim_async(claim)
+
+            return await asyncio.gather(*(bounded_verify(c) for c in claims))
+
+        return asyncio.run(_run_batch())
+
+
+@functools.lru_cache(maxsize=1)
+def get_detector() -> MisinformationDetector:
+    """Process-wide MisinformationDetector singleton.
+
+    Repeat callers (batch mode, the API server) share one detector —
+    and with it the LLM cache connection and lazily-built agents —
+    instead of re-running construction per call.
+    """
+    return MisinformationDetector()
+
+
+_EXIT_TOKENS = {'exit', 'quit', 'q', 'bye'}
+
+# Static half of the startup banner, formatted once at import — only
+# the date line stays dynamic.
+_CONFIG_BANNER = (
+    "⚙️ Configuration:\n"
+    f"  - Queries: {NUM_SEARCH_QUERIES}\n"
+    f"  - Parallel Workers: {MAX_PARALLEL_WORKERS}\n"
+    f"  - Max Tokens: {MAX_TOKENS_CONFIG}\n"
+    f"  - API Endpoint: {PERPLEXITY_URL}\n"
+    "  - Features: Dependency tracking, atomic decomposition\n"
+)
+
+
+async def _verify_claims_concurrently(detector: MisinformationDetector,
+                                      claims: List[str]) -> None:
+    """Verify a batch of claims on one event loop.
+
+    Fan-out is bounded by MAX_PARALLEL_WORKERS; progress output from
+    concurrent claims interleaves, but each result file is still written
+    per claim.
+    """
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_WORKERS)
+
+    async def bounded_verify(claim: str):
+        async with semaphore:
+            return await detector.verify_claim_async(claim)
+
+    outcomes = await asyncio.gather(
+        *(bounded_verify(c) for c in claims),
+        return_exceptions=True
+    )
+    for claim, outcome in zip(claims, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"\n❌ Error verifying '{claim[:60]}': {outcome}")
+
 
 def main():
     """Main entry point."""
@@ -845,45 +1429,59 @@ def main():
     print("🚀 MISINFORMATION DETECTION SYSTEM v2.2 (FINAL)")
     print("="*80)
     print(f"\n📅 Current Date: {datetime.now().strftime('%B %d, %Y')}")
-    print(f"⚙️ Configuration:")
-    print(f"  - Queries: {NUM_SEARCH_QUERIES}")
-    print(f"  - Parallel Workers: {MAX_PARALLEL_WORKERS}")
-    print(f"  - Max Tokens: {MAX_TOKENS_CONFIG}")
-    print(f"  - API Endpoint: {PERPLEXITY_URL}")
-    print(f"  - Features: Dependency tracking, atomic decomposition\n")
+    sys.stdout.write(_CONFIG_BANNER)
     
     try:
-        detector = MisinformationDetector()
+        detector = get_detector()
         print("\n✅ System initialization complete!")
         print("="*80)
     except Exception as e:
         print(f"\n❌ Initialization failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        _print_exc()
         return
     
+    # Piped input: read every line up front and verify them as one
+    # concurrent batch instead of strictly serially.
+    if not sys.stdin.isatty():
+        claims = [
+            line.strip() for line in sys.stdin.read().splitlines()
+            if line.strip() and line.strip().lower() not in _EXIT_TOKENS
+        ]
+        if claims:
+            print(f"\n📦 Batch mode: verifying {len(claims)} claims "
+                  f"({MAX_PARALLEL_WORKERS} at a time)")
+            asyncio.run(_verify_claims_concurrently(detector, claims))
+            sys.stdout.flush()
+        return
+
     while True:
         try:
-            claim = input("\n📝 Enter claim to verify (or 'exit' to quit): ").strip()
-            
-            if not claim:
+            entry = input("\n📝 Enter claim to verify (';' queues several, 'exit' to quit): ").strip()
+
+            if not entry:
                 continue
-            
-            if claim.lower() in ['exit', 'quit', 'q', 'bye']:
+
+            if entry.lower() in _EXIT_TOKENS:
                 print("\n👋 Goodbye!")
                 break
-            
-            results = detector.verify_claim(claim)
-            print("\n" + "="*80)
-        
+
+            claims = [c.strip() for c in entry.split(';') if c.strip()]
+            if len(claims) > 1:
+                asyncio.run(_verify_claims_concurrently(detector, claims))
+            else:
+                results = detector.verify_claim(claims[0])
+            # One write of pre-encoded bytes instead of rebuilding the
+            # separator string each iteration.
+            sys.stdout.buffer.write(SEPARATOR)
+            sys.stdout.flush()
+
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
             break
-        
+
         except Exception as e:
             print(f"\n❌ Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            _print_exc()
 
 
 if __name__ == "__main__":